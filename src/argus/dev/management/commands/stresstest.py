@@ -1,3 +1,7 @@
+from argparse import ArgumentTypeError
+import asyncio
+import sys
+
 from httpx import TimeoutException, HTTPStatusError, HTTPError
 
 from django.core.management.base import BaseCommand
@@ -5,6 +9,20 @@ from django.core.management.base import BaseCommand
 from argus.dev.utils import StressTester, DatabaseMismatchError
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
 class Command(BaseCommand):
     help = "Stresstests incident creation API"
 
@@ -27,26 +45,64 @@ class Command(BaseCommand):
             default=10,
         )
         parser.add_argument("-t", "--timeout", type=int, help="Timeout for requests. Default 5s", default=5)
-        parser.add_argument("-w", "--workers", type=int, help="Number of workers. Default 1", default=1)
+        parser.add_argument("-w", "--workers", type=positive_int, help="Number of workers. Default 1", default=1)
         parser.add_argument("-b", "--bulk", action="store_true", help="Bulk ACK created incidents")
+        parser.add_argument(
+            "-n",
+            "--batch-size",
+            type=positive_int,
+            help="Number of incidents each worker sends concurrently before waiting for responses. Default 1",
+            default=1,
+        )
+        parser.add_argument(
+            "-e",
+            "--max-errors",
+            type=non_negative_int,
+            help="Number of failed or timed out incident creation requests to skip before aborting. Default 0",
+            default=0,
+        )
 
     def handle(self, *args, **options):
-        tester = StressTester(options.get("url"), options.get("token"), options.get("timeout"), options.get("workers"))
+        tester = StressTester(
+            options.get("url"),
+            options.get("token"),
+            options.get("timeout"),
+            options.get("workers"),
+            options.get("batch_size"),
+            options.get("max_errors"),
+        )
         try:
+            self._run_in_event_loop(self._run(tester, options))
+        except (DatabaseMismatchError, HTTPStatusError, TimeoutException) as e:
+            self.stderr.write(self.style.ERROR(str(e)))
+        except HTTPError as e:
+            self.stderr.write(self.style.ERROR(f"HTTP Error: {e}"))
+
+    def _run_in_event_loop(self, coro):
+        # Only this run uses uvloop, the event loop policy of the process is left alone
+        try:
+            import uvloop
+        except ImportError:
+            return asyncio.run(coro)
+        if sys.version_info >= (3, 12):
+            return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+        return uvloop.run(coro)
+
+    async def _run(self, tester, options):
+        # Python 3.12+: run tasks eagerly until they first need to wait
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+        async with tester:
             self.stdout.write("Running stresstest ...")
-            incident_ids, runtime = tester.run(options.get("seconds"))
+            incident_ids, runtime = await tester.run(options.get("seconds"))
             requests_per_second = round(len(incident_ids) / runtime.total_seconds(), 2)
             self.stdout.write("Verifying incidents were created correctly ...")
-            tester.verify(incident_ids)
+            await tester.verify(incident_ids)
             if options.get("bulk"):
                 self.stdout.write("Bulk ACKing incidents ...")
-                tester.bulk_ack(incident_ids)
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Stresstest completed. Runtime: {runtime}. Incidents created: {len(incident_ids)}. Average incidents per second: {requests_per_second}."
-                )
+                await tester.bulk_ack(incident_ids)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stresstest completed. Runtime: {runtime}. Incidents created: {len(incident_ids)}. Average incidents per second: {requests_per_second}. Failed requests: {tester.error_count}."
             )
-        except (DatabaseMismatchError, HTTPStatusError, TimeoutException) as e:
-            self.stderr.write(self.style.ERROR(e))
-        except HTTPError as e:
-            self.stderr.write(self.style.ERROR(f"HTTP Error: {e}"))
+        )
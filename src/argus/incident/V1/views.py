@@ -127,7 +127,7 @@ class SourceLockedIncidentViewSetV1(IncidentViewSetV1):
     filterset_class = SourceLockedIncidentFilter
 
     def get_queryset(self):
-        return Incident.objects.filter(source__user=self.request.user).prefetch_default_related()
+        return Incident.objects.filter(source__user=self.request.user).prefetch_default_related().annotate_acked()
 
 
 @extend_schema_view(
@@ -165,7 +165,7 @@ class AcknowledgementViewSetV1(
         return get_object_or_404(Incident.objects.all(), pk=incident_pk)
 
     def get_queryset(self):
-        return self.get_incident().acks
+        return self.get_incident().acks.select_related("event__actor")
 
     def perform_create(self, serializer: AcknowledgementSerializerV1):
         user = self.request.user
@@ -191,7 +191,7 @@ class OpenUnAckedIncidentListV1(generics.ListAPIView):
     serializer_class = IncidentSerializerV1
 
     def get_queryset(self):
-        return Incident.objects.open().not_acked().prefetch_default_related()
+        return Incident.objects.open().not_acked().prefetch_default_related().annotate_acked()
 
 
 @extend_schema_view(get=extend_schema(deprecated=True))
@@ -208,4 +208,4 @@ class OpenIncidentListV1(generics.ListAPIView):
     serializer_class = IncidentSerializerV1
 
     def get_queryset(self):
-        return Incident.objects.open().prefetch_default_related()
+        return Incident.objects.open().prefetch_default_related().annotate_acked()
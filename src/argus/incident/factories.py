@@ -1,5 +1,6 @@
+from datetime import timezone
+
 import factory, factory.fuzzy
-import pytz
 
 from argus.auth.factories import SourceUserFactory
 from argus.util.datetime_utils import INFINITY_REPR
@@ -49,7 +50,7 @@ class IncidentFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = models.Incident
 
-    start_time = factory.Faker("date_time_between", start_date="-1d", end_date="+1d", tzinfo=pytz.UTC)
+    start_time = factory.Faker("date_time_between", start_date="-1d", end_date="+1d", tzinfo=timezone.utc)
     end_time = INFINITY_REPR
     source = factory.SubFactory(SourceSystemFactory)
     source_incident_id = factory.Sequence(lambda s: s)
@@ -74,7 +75,7 @@ class IncidentTagRelationFactory(factory.django.DjangoModelFactory):
     tag = factory.SubFactory(TagFactory)
     incident = factory.SubFactory(IncidentFactory)
     added_by = factory.SubFactory(SourceUserFactory)
-    added_time = factory.Faker("date_time_between", start_date="-1d", end_date="+1d", tzinfo=pytz.UTC)
+    added_time = factory.Faker("date_time_between", start_date="-1d", end_date="+1d", tzinfo=timezone.utc)
 
 
 class EventFactory(factory.django.DjangoModelFactory):
@@ -83,7 +84,7 @@ class EventFactory(factory.django.DjangoModelFactory):
 
     incident = factory.SubFactory(IncidentFactory)
     actor = factory.SubFactory(SourceUserFactory)
-    timestamp = factory.Faker("date_time_between", start_date="-1d", end_date="+1d", tzinfo=pytz.UTC)
+    timestamp = factory.Faker("date_time_between", start_date="-1d", end_date="+1d", tzinfo=timezone.utc)
     received = timestamp
     type = models.Event.Type.OTHER
     description = factory.Faker("sentence")
@@ -94,4 +95,4 @@ class AcknowledgementFactory(factory.django.DjangoModelFactory):
         model = models.Acknowledgement
 
     event = factory.SubFactory(EventFactory, type=models.Event.Type.ACKNOWLEDGE)
-    expiration = factory.Faker("date_time_between", start_date="+1d", end_date="+2d", tzinfo=pytz.UTC)
+    expiration = factory.Faker("date_time_between", start_date="+1d", end_date="+2d", tzinfo=timezone.utc)
@@ -6,18 +6,12 @@ from django.db import migrations, models
 def add_stateless_event_type(apps, schema_editor):
     # Change INCIDENT_START events for stateless incidents to STATELESS
     Event = apps.get_model('argus_incident', 'Event')
-    for event in Event.objects.all():
-        if event.type == "STA" and event.incident.end_time == None:
-            event.type="LES"
-            event.save()
+    Event.objects.filter(type="STA", incident__end_time__isnull=True).update(type="LES")
 
 def remove_stateless_event_type(apps, schema_editor):
     # undo changes made by add_stateless_event_type
     Event = apps.get_model('argus_incident', 'Event')
-    for event in Event.objects.all():
-        if event.type == "LES":
-            event.type = "STA"
-            event.save()
+    Event.objects.filter(type="LES").update(type="STA")
 
 class Migration(migrations.Migration):
 
@@ -3,22 +3,28 @@
 from django.db import migrations, models
 
 
+BATCH_SIZE = 1000
+
+
 def fill_search_text(apps, schema_editor):
     # Fills in search_text field
     Incident = apps.get_model('argus_incident', 'Incident')
-    for incident in Incident.objects.all():
+    batch = []
+    for incident in Incident.objects.only("id").prefetch_related("events").iterator(chunk_size=BATCH_SIZE):
         search_fields = []
         for event in incident.events.all():
             search_fields.append(event.description)
         incident.search_text = " ".join(search_fields)
-        incident.save()
+        batch.append(incident)
+        if len(batch) == BATCH_SIZE:
+            Incident.objects.bulk_update(batch, ["search_text"])
+            batch = []
+    Incident.objects.bulk_update(batch, ["search_text"])
 
 def clear_search_text(apps, schema_editor):
     # clears search_text field
     Incident = apps.get_model('argus_incident', 'Incident')
-    for incident in Incident.objects.all():
-        incident.search_text = ""
-        incident.save()
+    Incident.objects.update(search_text="")
 
 
 class Migration(migrations.Migration):
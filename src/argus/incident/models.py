@@ -9,7 +9,7 @@ from urllib.parse import urljoin
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from django.db import models
-from django.db.models import F, Q
+from django.db.models import Exists, F, OuterRef, Q
 from django.utils import timezone
 
 from argus.auth.models import User
@@ -263,6 +263,14 @@ class IncidentQuerySet(models.QuerySet):
     def prefetch_default_related(self):
         return self.prefetch_related("incident_tag_relations__tag", "source__type")
 
+    def annotate_acked(self):
+        """
+        Annotates whether each incident is acked, so that reading
+        ``Incident.acked`` does not cost a query per incident
+        """
+        acked_events = Event.objects.filter(Incident.get_acked_events_query(), incident=OuterRef("pk"))
+        return self.annotate(_acked=Exists(acked_events))
+
     def from_tags(self, *tags):
         tag_qss = Tag.objects.parse(*tags)
         qs = []
@@ -491,8 +499,8 @@ class Incident(models.Model):
     def acks(self):
         return Acknowledgement.objects.filter(event__incident=self)
 
-    @property
-    def acked(self):
+    @staticmethod
+    def get_acked_events_query():
         acks_query = Q(ack__isnull=False)
         acks_not_expired_query = Q(ack__expiration__isnull=True) | Q(ack__expiration__gt=timezone.now())
         # This is specifically for when acks are just created
@@ -501,7 +509,14 @@ class Incident(models.Model):
         # which is why we have to have this additional check
         ack_is_just_being_created = Q(type=Event.Type.ACKNOWLEDGE) & Q(ack__isnull=True)
 
-        return self.events.filter((acks_query & acks_not_expired_query) | ack_is_just_being_created).exists()
+        return (acks_query & acks_not_expired_query) | ack_is_just_being_created
+
+    @property
+    def acked(self):
+        # Set by IncidentQuerySet.annotate_acked()
+        if hasattr(self, "_acked"):
+            return self._acked
+        return self.events.filter(self.get_acked_events_query()).exists()
 
     def create_first_event(self):
         """Create the correct type of first event for an incident
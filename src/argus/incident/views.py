@@ -103,7 +103,7 @@ class SourceSystemViewSet(
     viewsets.GenericViewSet,
 ):
     permission_classes = [IsSuperuserOrReadOnly]
-    queryset = SourceSystem.objects.all()
+    queryset = SourceSystem.objects.select_related("type")
     serializer_class = SourceSystemSerializer
 
     def create(self, request, *args, **kwargs):
@@ -240,11 +240,15 @@ class IncidentViewSet(
 
     pagination_class = IncidentPagination
     permission_classes = [IsAuthenticated]
-    queryset = Incident.objects.prefetch_default_related().prefetch_related("source")
+    queryset = Incident.objects.prefetch_default_related()
     filter_backends = [filters.DjangoFilterBackend, SearchFilter]
     filterset_class = IncidentFilter
     search_fields = ["description", "search_text"]
 
+    def get_queryset(self):
+        # Whether an ack has expired depends on the time of the request
+        return super().get_queryset().annotate_acked()
+
     def get_serializer_class(self):
         if self.request.method in {"PUT", "PATCH"}:
             return IncidentPureDeserializer
@@ -468,7 +472,7 @@ class SourceLockedIncidentViewSet(IncidentViewSet):
     filterset_class = SourceLockedIncidentFilter
 
     def get_queryset(self):
-        return Incident.objects.filter(source__user=self.request.user).prefetch_default_related()
+        return Incident.objects.filter(source__user=self.request.user).prefetch_default_related().annotate_acked()
 
 
 @extend_schema_view(
@@ -496,7 +500,7 @@ class EventViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, mixins.Retrie
     def get_queryset(self):
         incident_pk = self.kwargs["incident_pk"]
         incident = get_object_or_404(Incident.objects.all(), pk=incident_pk)
-        return incident.events.all()
+        return incident.events.select_related("actor")
 
     def perform_create(self, serializer: EventSerializer):
         user = self.request.user
@@ -597,7 +601,7 @@ class AcknowledgementViewSet(rw_viewsets.ModelViewSet):
         return get_object_or_404(Incident.objects.all(), pk=incident_pk)
 
     def get_queryset(self):
-        return self.get_incident().acks
+        return self.get_incident().acks.select_related("event__actor")
 
     def perform_create(self, serializer: RequestAcknowledgementSerializer):
         user = self.request.user
@@ -114,7 +114,7 @@ def get_notification_media(destinations: Iterable[DestinationConfig]):
     destination_slugs = set([destination.media.slug for destination in destinations])
     media = []
     for slug in destination_slugs:
-        if slug in MEDIA_CLASSES_DICT.keys():
+        if slug in MEDIA_CLASSES_DICT:
             media.append(MEDIA_CLASSES_DICT[slug])
         else:
             LOG.warning("Medium %s was not found in imported media.", slug)
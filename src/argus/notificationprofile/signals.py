@@ -31,7 +31,7 @@ def sync_media(sender, **kwargs):
 
     try:
         for medium in Media.objects.all():
-            if medium.slug not in MEDIA_CLASSES_DICT.keys():
+            if medium.slug not in MEDIA_CLASSES_DICT:
                 LOG.warning("%s plugin is not registered in MEDIA_PLUGINS", medium.name)
                 # Need to check in case of backwards migrations
                 if getattr(medium, "installed", None):
@@ -48,6 +48,8 @@ TEST_OUTPUT_VERBOSE = 2
 # reports land directly in test-reports/
 TEST_OUTPUT_DIR = os.path.join("test-reports", os.getenv("TOX_ENV_NAME", ""))
 TEST_OUTPUT_FILE_NAME = "test-results.xml"
+# The tests never need strong password hashes, and the default hasher is slow by design
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
 # PSA for login
 
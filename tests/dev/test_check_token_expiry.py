@@ -1,10 +1,10 @@
-from datetime import datetime, timedelta
+from datetime import timedelta
 from io import StringIO
-import pytz
 
 from django.conf import settings
 from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
 from rest_framework.authtoken.models import Token
 
 from argus.dev.management.commands.check_token_expiry import (
@@ -117,7 +117,7 @@ class CheckTokenExpiryTests(TestCase):
         self.assertFalse(Incident.objects.get(pk=self.expiry_incident.pk).open)
 
     def test_expiry_incident_is_closed_when_token_updated(self):
-        self.expiring_token.created = datetime.now(pytz.utc)
+        self.expiring_token.created = timezone.now()
         self.expiring_token.save()
         self.assertFalse(Incident.objects.get(pk=self.expiry_incident.pk).open)
 
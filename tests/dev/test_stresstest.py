@@ -0,0 +1,58 @@
+import asyncio
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase
+from httpx import AsyncClient, MockTransport, Response
+
+from argus.dev.utils import StressTester
+
+
+class StresstestTests(SimpleTestCase):
+    def get_mock_client(self, failing_post_count):
+        """Returns a client for a fake Argus that fails the first `failing_post_count` incident creations"""
+        posts = []
+
+        async def handler(request):
+            # Keeps the number of requests sent during the test run small
+            await asyncio.sleep(0.05)
+            if request.method == "POST":
+                posts.append(request)
+                if len(posts) <= failing_post_count:
+                    return Response(500)
+                return Response(201, json={"pk": len(posts)})
+            return Response(200, json={"description": "Stresstest", "tags": [{"tag": "problem_type=stresstest"}]})
+
+        return AsyncClient(transport=MockTransport(handler))
+
+    def test_stresstest_reports_number_of_failed_requests(self):
+        out = StringIO()
+        mock_client = patch.object(StressTester, "_get_client", return_value=self.get_mock_client(2))
+        with mock_client, self.assertLogs("argus.dev.utils", level="WARNING"):
+            call_command("stresstest", "http://localhost.com", "token", seconds=1, max_errors=2, stdout=out)
+        self.assertIn("Stresstest completed.", out.getvalue())
+        self.assertIn("Failed requests: 2.", out.getvalue())
+
+    def test_stresstest_aborts_when_failed_requests_exceed_max_errors(self):
+        out = StringIO()
+        err = StringIO()
+        mock_client = patch.object(StressTester, "_get_client", return_value=self.get_mock_client(3))
+        with mock_client, self.assertLogs("argus.dev.utils", level="WARNING"):
+            call_command("stresstest", "http://localhost.com", "token", seconds=1, max_errors=2, stdout=out, stderr=err)
+        self.assertNotIn("Stresstest completed.", out.getvalue())
+        self.assertIn("HTTP Error 500", err.getvalue())
+
+    def test_stresstest_rejects_too_few_workers_incidents_per_batch_or_errors(self):
+        invalid_values = (
+            ("--workers", "0"),
+            ("--workers", "-1"),
+            ("--batch-size", "0"),
+            ("--batch-size", "-1"),
+            ("--max-errors", "-5"),
+        )
+        for option, value in invalid_values:
+            with self.subTest(option=option, value=value):
+                with self.assertRaises(CommandError):
+                    call_command("stresstest", "http://localhost.com", "token", option, value)
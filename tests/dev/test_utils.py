@@ -1,10 +1,26 @@
+import json
+
 from django.test import TestCase
+from httpx import AsyncClient, HTTPStatusError, MockTransport, ReadTimeout, Response, TimeoutException
 
 from argus.dev.utils import StressTester, DatabaseMismatchError
 
 from argus.util.testing import connect_signals, disconnect_signals
 
 
+def get_mock_client(*responses):
+    """Returns a client answering its requests with `responses` in order. Exceptions in `responses` are raised"""
+    responses = iter(responses)
+
+    def handler(request):
+        response = next(responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return AsyncClient(transport=MockTransport(handler))
+
+
 class StressTesterTests(TestCase):
     def setUp(self):
         disconnect_signals()
@@ -14,23 +30,19 @@ class StressTesterTests(TestCase):
         connect_signals()
 
     def test_verify_tags_raise_error_for_incorrect_tags(self):
-        expected_data = {
-            "tags": [{"tag": "tag1=value1"}, {"tag": "tag2=value2"}],
-        }
+        expected_tags = frozenset(["tag1=value1", "tag2=value2"])
         actual_data = {
             "tags": [{"tag": "tag1=value2"}, {"tag": "tag2=value1"}],
         }
         with self.assertRaises(DatabaseMismatchError):
-            self.stresstester._verify_tags(actual_data, expected_data)
+            self.stresstester._verify_tags(actual_data, expected_tags)
 
     def test_verify_tags_does_not_raise_exception_for_correct_tags(self):
-        expected_data = {
-            "tags": [{"tag": "tag1=value1"}, {"tag": "tag2=value2"}],
-        }
+        expected_tags = frozenset(["tag1=value1", "tag2=value2"])
         actual_data = {
             "tags": [{"tag": "tag1=value1"}, {"tag": "tag2=value2"}],
         }
-        self.stresstester._verify_tags(actual_data, expected_data)
+        self.stresstester._verify_tags(actual_data, expected_tags)
 
     def test_verify_description_raise_error_for_incorrect_description(self):
         expected_data = {
@@ -59,3 +71,60 @@ class StressTesterTests(TestCase):
 
     def test_get_incidents_v2_url_returns_correct_url(self):
         self.assertEqual(self.stresstester._get_incidents_v2_url(), "http://localhost.com/api/v2/incidents/")
+
+    def test_get_client_limits_allows_one_connection_per_request_in_flight(self):
+        stresstester = StressTester("http://localhost.com", "token", 10, 3, batch_size=4)
+        limits = stresstester._get_client_limits()
+        self.assertEqual(limits.max_connections, 12)
+        self.assertEqual(limits.max_keepalive_connections, 12)
+
+    def test_handle_post_error_skips_errors_within_budget(self):
+        stresstester = StressTester("http://localhost.com", "token", 10, 1, max_errors=1)
+        with self.assertLogs("argus.dev.utils", level="WARNING"):
+            stresstester._handle_post_error(TimeoutException("timeout"))
+        self.assertEqual(stresstester.error_count, 1)
+
+    def test_handle_post_error_raises_error_when_budget_is_exceeded(self):
+        stresstester = StressTester("http://localhost.com", "token", 10, 1, max_errors=1)
+        with self.assertLogs("argus.dev.utils", level="WARNING"):
+            stresstester._handle_post_error(TimeoutException("timeout"))
+        with self.assertRaises(TimeoutException):
+            stresstester._handle_post_error(TimeoutException("timeout"))
+
+    async def test_post_incident_skips_timeouts_and_server_errors_within_budget(self):
+        stresstester = StressTester("http://localhost.com", "token", 10, 1, max_errors=2)
+        url = stresstester._get_incidents_v1_url()
+        client = get_mock_client(ReadTimeout("timeout"), Response(500), Response(201, json={"pk": 1}))
+        async with client:
+            with self.assertLogs("argus.dev.utils", level="WARNING"):
+                pks = [await stresstester._post_incident(url, b"{}", {}, client) for _ in range(3)]
+        self.assertEqual(pks, [None, None, 1])
+        self.assertEqual(stresstester.error_count, 2)
+
+    async def test_post_incident_raises_error_when_budget_is_exceeded(self):
+        stresstester = StressTester("http://localhost.com", "token", 10, 1, max_errors=1)
+        url = stresstester._get_incidents_v1_url()
+        client = get_mock_client(Response(500), Response(503))
+        async with client:
+            with self.assertLogs("argus.dev.utils", level="WARNING"):
+                self.assertIsNone(await stresstester._post_incident(url, b"{}", {}, client))
+            with self.assertRaises(HTTPStatusError):
+                await stresstester._post_incident(url, b"{}", {}, client)
+        self.assertEqual(stresstester.error_count, 2)
+
+    async def test_bulk_ack_sends_ids_in_chunks(self):
+        incident_ids = list(range(1, 2 * StressTester.BULK_ACK_CHUNK_SIZE + 501))
+        sent_ids = []
+
+        def handler(request):
+            sent_ids.append(json.loads(request.content)["ids"])
+            return Response(201, json=[])
+
+        async with AsyncClient(transport=MockTransport(handler)) as client:
+            self.stresstester._client = client
+            await self.stresstester.bulk_ack(incident_ids)
+
+        self.assertEqual(len(sent_ids), 3)
+        for ids in sent_ids:
+            self.assertLessEqual(len(ids), StressTester.BULK_ACK_CHUNK_SIZE)
+        self.assertEqual(sorted(pk for ids in sent_ids for pk in ids), incident_ids)
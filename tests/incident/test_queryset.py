@@ -55,6 +55,22 @@ class IncidentQuerySetTestCase(TestCase):
         result = Incident.objects.not_acked()
         self.assertEqual(set(result), set(Incident.objects.all()))
 
+    def test_annotate_acked(self):
+        user = PersonUserFactory()
+        self.incident2.create_ack(user)
+        # Create an expired ack
+        self.incident3.create_ack(user, expiration=self.timestamp)
+        result = {incident.pk: incident.acked for incident in Incident.objects.annotate_acked()}
+        expected = {incident.pk: incident.acked for incident in Incident.objects.all()}
+        self.assertEqual(result, expected)
+        self.assertTrue(result[self.incident2.pk])
+        self.assertFalse(result[self.incident3.pk])
+
+    def test_annotate_acked_needs_no_query_per_incident(self):
+        incidents = list(Incident.objects.annotate_acked())
+        with self.assertNumQueries(0):
+            [incident.acked for incident in incidents]
+
     def test_has_ticket(self):
         result = Incident.objects.has_ticket()
         self.assertEqual(result.get(), self.incident4)
@@ -41,10 +41,10 @@ class SourceSystemPostingTests(APITestCase):
         self.assertEqual(SourceSystem.objects.count(), 0)
         self.assertEqual(User.objects.count(), 1)
         self._post_source1_dict(url, client)
-        self.assertEqual(SourceSystem.objects.count(), 1)
         self.assertEqual(User.objects.count(), 2)
 
-        source1 = SourceSystem.objects.get(name=self.source1_dict["name"])
+        # get() without arguments also checks that exactly one source was added
+        source1 = SourceSystem.objects.get()
         self.assertEqual(source1.name, self.source1_dict["name"])
         self.assertEqual(source1.type.pk, self.source1_dict["type"])
         self.assertEqual(source1.user.username, self.source1_dict["username"])
@@ -115,10 +115,10 @@ class SourceSystemPostingTests(APITestCase):
         self.assertEqual(SourceSystem.objects.count(), 0)
         self.assertEqual(User.objects.count(), 1)
         client.post(url, source_no_username_dict)
-        self.assertEqual(SourceSystem.objects.count(), 1)
         self.assertEqual(User.objects.count(), 2)
 
-        source = SourceSystem.objects.get(name=source_name)
+        source = SourceSystem.objects.get()
+        self.assertEqual(source.name, source_name)
         self.assertEqual(source.user.username, source_name)
 
     def test_posting_empty_source_system_username_to_serializer_should_use_source_system_name_as_username(self):
@@ -1,8 +1,12 @@
 import datetime
+import json
+from types import MappingProxyType
+from unittest.mock import patch
 
+from django.db.models import Max
 from django.urls import reverse
 from django.utils.timezone import now
-from django.test import TestCase, RequestFactory
+from django.test import SimpleTestCase, RequestFactory
 
 from rest_framework import serializers, status, versioning
 from rest_framework.test import APITestCase
@@ -11,12 +15,8 @@ from argus.auth.factories import AdminUserFactory, BaseUserFactory, SourceUserFa
 from argus.incident.factories import (
     AcknowledgementFactory,
     EventFactory,
-    IncidentTagRelationFactory,
-    SourceSystemTypeFactory,
-    SourceSystemFactory,
     StatefulIncidentFactory,
     StatelessIncidentFactory,
-    TagFactory,
 )
 from argus.incident.models import (
     Acknowledgement,
@@ -30,21 +30,64 @@ from argus.incident.models import (
 from argus.incident.views import EventViewSet
 from argus.notificationprofile.factories import FilterFactory
 from argus.notificationprofile.models import Filter
+from argus.util.datetime_utils import INFINITY_REPR, LOCAL_INFINITY
 from argus.util.testing import disconnect_signals, connect_signals
 
 
-class EventViewSetTestCase(TestCase):
-    def setUp(self):
-        disconnect_signals()
-        source_type = SourceSystemTypeFactory()
-        source_user = SourceUserFactory()
-        self.source = SourceSystemFactory(type=source_type, user=source_user)
+# Read-only request data shared between tests
+# Minimal data to post that has tags
+INCIDENT_DATA = MappingProxyType(
+    {
+        "start_time": "2021-08-04T09:13:55.908Z",
+        "end_time": "2021-08-04T09:13:55.908Z",
+        "description": "incident",
+        "level": 1,
+        "tags": (MappingProxyType({"tag": "a=b"}),),
+    }
+)
+ACK_DATA = MappingProxyType(
+    {
+        "timestamp": "2022-08-02T13:04:03.529Z",
+        "description": "acknowledgement",
+        "expiration": "2022-08-03T13:04:03.529Z",
+    }
+)
+EVENT_DATA = MappingProxyType(
+    {
+        "timestamp": "2022-08-02T13:04:03.529Z",
+        "description": "event",
+        "type": "OTH",
+    }
+)
+
+
+def dump_json(data):
+    # The json module does not know the read-only MappingProxyType
+    return json.dumps(data, default=dict)
+
+
+# No test in this module needs the notification signals
+def setUpModule():
+    disconnect_signals()
+
+
+def tearDownModule():
+    connect_signals()
 
-    def tearDown(self):
-        connect_signals()
 
+class JSONAPITestCase(APITestCase):
+    # Encoding the data up front skips the test client's renderer lookup for every request
+    def post_json(self, path, data):
+        return self.client.post(path=path, data=dump_json(data), content_type="application/json")
+
+    def put_json(self, path, data):
+        return self.client.put(path=path, data=dump_json(data), content_type="application/json")
+
+
+class EventViewSetTestCase(SimpleTestCase):
     def test_validate_event_type_for_incident_acknowledge_raises_validation_error(self):
-        incident = StatefulIncidentFactory(source=self.source)
+        # Validating an ACK only looks at the incident's state, so it need not be saved
+        incident = Incident(pk=1, start_time=now(), end_time=LOCAL_INFINITY)
         viewfactory = RequestFactory()
         request = viewfactory.get(f"/api/v1/incidents/{incident.pk}/events/")
         request.versioning_scheme = versioning.NamespaceVersioning()
@@ -55,41 +98,59 @@ class EventViewSetTestCase(TestCase):
             view.validate_event_type_for_incident(Event.Type.ACKNOWLEDGE, incident)
 
 
-class IncidentAPITestCase(APITestCase):
+class IncidentAPITestCase(JSONAPITestCase):
+    # Created once per class, every test is rolled back to this state
+    @classmethod
+    def setUpTestData(cls):
+        # The get_or_create lookups of the source factories are not needed in an empty database
+        source_type = SourceSystemType.objects.create(name="type")
+        cls.user = SourceUserFactory()
+        cls.source = SourceSystem.objects.create(name="source", type=source_type, user=cls.user)
+        cls.admin = AdminUserFactory()
+
     def setUp(self):
-        disconnect_signals()
-        source_type = SourceSystemTypeFactory()
-        self.user = SourceUserFactory()
-        self.source = SourceSystemFactory(type=source_type, user=self.user)
-        self.admin = AdminUserFactory()
         self.client.force_authenticate(user=self.user)
 
-    def teardown(self):
-        connect_signals()
-
-
-class IncidentViewSetV1TestCase(IncidentAPITestCase):
     def add_open_incident_with_start_event_and_tag(self, description="incident"):
-        incident = StatefulIncidentFactory(source=self.source, description=description)
-        tag = TagFactory(key="a", value="b")
-        IncidentTagRelationFactory(incident=incident, tag=tag)
-        incident.create_first_event()
+        # Plain ORM calls are a lot cheaper than going through the factories
+        timestamp = now()
+        incident = Incident.objects.create(
+            start_time=timestamp, end_time=INFINITY_REPR, source=self.source, description=description
+        )
+        tag, _ = Tag.objects.get_or_create(key="a", value="b")
+        IncidentTagRelation.objects.create(incident=incident, tag=tag, added_by=self.user)
+        Event.objects.create(
+            incident=incident,
+            actor=self.user,
+            timestamp=timestamp,
+            type=Event.Type.INCIDENT_START,
+            description=description,
+        )
         return incident
 
     def add_acknowledgement_with_incident_and_event(self):
         return AcknowledgementFactory()
 
+
+class IncidentViewSetTestsMixin:
+    """Tests that are the same for every API version, subclasses must set `api_version`"""
+
+    api_version = None
+
     def test_no_incidents_returns_empty_list(self):
-        response = self.client.get("/api/v1/incidents/")
+        response = self.client.get(f"/api/{self.api_version}/incidents/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Paging, so check "results"
         self.assertEqual(response.data["results"], [])
 
     def test_can_get_all_incidents(self):
-        self.add_open_incident_with_start_event_and_tag()
+        for description in ("incident1", "incident2", "incident3"):
+            self.add_open_incident_with_start_event_and_tag(description=description)
         incident_pks = list(Incident.objects.all().values_list("pk", flat=True))
 
-        response = self.client.get(path="/api/v1/incidents/")
+        # The number of queries must not grow with the number of incidents
+        with self.assertNumQueries(5):
+            response = self.client.get(path=f"/api/{self.api_version}/incidents/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Paging, so check "results"
@@ -98,37 +159,39 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
 
     def test_can_get_specific_incident(self):
         incident_pk = self.add_open_incident_with_start_event_and_tag().pk
-        response = self.client.get(path=f"/api/v1/incidents/{incident_pk}/")
+        response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident_pk}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["pk"], incident_pk)
 
-    def test_can_create_incident_with_tag(self):
-        # Minimal data to post that has tags
-        data = {
-            "start_time": "2021-08-04T09:13:55.908Z",
-            "end_time": "2021-08-04T09:13:55.908Z",
-            "description": "incident",
-            "level": 1,
-            "tags": [{"tag": "a=b"}],
-        }
+    def test_incident_is_not_acked_after_its_ack_expires(self):
+        incident = self.add_open_incident_with_start_event_and_tag()
+        timestamp = now()
+        event = Event.objects.create(
+            incident=incident, actor=self.user, timestamp=timestamp, type=Event.Type.ACKNOWLEDGE
+        )
+        Acknowledgement.objects.create(event=event, expiration=timestamp + datetime.timedelta(seconds=1))
+
+        # The ack has expired by the time of the request
+        with patch("django.utils.timezone.now", return_value=timestamp + datetime.timedelta(minutes=5)):
+            response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident.pk}/")
 
-        response = self.client.post(path="/api/v1/incidents/", data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["acked"])
+
+    def test_can_create_incident_with_tag(self):
+        data = INCIDENT_DATA
+        response = self.post_json(f"/api/{self.api_version}/incidents/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        # Check that we have made the correct Incident
-        self.assertTrue(Incident.objects.filter(id=response.data["pk"]).exists())
-        incident = Incident.objects.get(id=response.data["pk"])
-        # Check that we have made the correct Tag
-        tag = data["tags"][0]["tag"]
-        key, value = Tag.split(tag)
-        self.assertTrue(Tag.objects.filter(key=key, value=value).exists())
-        tag = Tag.objects.get(key=key, value=value)
-        # Check that incident and tag are linked
-        self.assertTrue(IncidentTagRelation.objects.filter(incident=incident).filter(tag=tag).exists())
+        # Check that we have made the correct Incident, linked to the correct Tag
+        incident = Incident.objects.prefetch_related("incident_tag_relations__tag").get(id=response.data["pk"])
+        self.assertEqual(incident.description, data["description"])
+        incident_tags = [str(relation.tag) for relation in incident.incident_tag_relations.all()]
+        self.assertEqual(incident_tags, [data["tags"][0]["tag"]])
 
     def test_can_update_incident_level(self):
-        incident_pk = self.add_open_incident_with_start_event_and_tag().pk
-        incident_path = reverse("v1:incident:incident-detail", args=[incident_pk])
+        incident = self.add_open_incident_with_start_event_and_tag()
+        incident_path = reverse(f"{self.api_version}:incident:incident-detail", args=[incident.pk])
         response = self.client.patch(
             path=incident_path,
             data={
@@ -136,14 +199,18 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
             },
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(Incident.objects.get(pk=incident_pk).level, 2)
+        incident.refresh_from_db()
+        self.assertEqual(incident.level, 2)
 
     def test_can_get_all_acknowledgements_of_incident(self):
-        ack = self.add_acknowledgement_with_incident_and_event()
-        incident = ack.event.incident
+        incident = self.add_open_incident_with_start_event_and_tag()
+        for _ in range(3):
+            AcknowledgementFactory(event__incident=incident)
         ack_pks = list(incident.acks.all().values_list("pk", flat=True))
 
-        response = self.client.get(path=f"/api/v1/incidents/{incident.pk}/acks/")
+        # The number of queries must not grow with the number of acks
+        with self.assertNumQueries(2):
+            response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident.pk}/acks/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_pks = [ack["pk"] for ack in response.data]
@@ -154,33 +221,18 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
     def test_can_get_specific_acknowledgement_of_incident(self):
         ack = self.add_acknowledgement_with_incident_and_event()
         incident_pk = ack.event.incident.pk
-        response = self.client.get(path=f"/api/v1/incidents/{incident_pk}/acks/{ack.pk}/")
+        response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident_pk}/acks/{ack.pk}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["event"]["pk"], ack.pk)
         self.assertEqual(response.data["event"]["type"]["value"], "ACK")
 
-    def test_can_create_acknowledgement_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        data = {
-            "event": {
-                "timestamp": "2022-08-02T13:04:03.529Z",
-                "type": "STA",
-                "description": "acknowledgement",
-            },
-            "expiration": "2022-08-03T13:04:03.529Z",
-        }
-        response = self.client.post(path=f"/api/v1/incidents/{incident.pk}/acks/", data=data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(incident.events.filter(id=response.data["pk"]).exists())
-        self.assertTrue(Acknowledgement.objects.filter(event_id=response.data["pk"]).exists())
-
     def test_can_update_acknowledgement_of_incident(self):
         ack = self.add_acknowledgement_with_incident_and_event()
         incident = ack.event.incident
         data = {
             "expiration": (now() + datetime.timedelta(days=3)).isoformat(),
         }
-        response = self.client.put(path=f"/api/v1/incidents/{incident.pk}/acks/{ack.pk}/", data=data)
+        response = self.client.put(path=f"/api/{self.api_version}/incidents/{incident.pk}/acks/{ack.pk}/", data=data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(
             incident.events.get(pk=ack.pk).ack.expiration, datetime.datetime.fromisoformat(data["expiration"])
@@ -188,9 +240,13 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
 
     def test_can_get_all_events_of_incident(self):
         incident = self.add_open_incident_with_start_event_and_tag()
+        for _ in range(2):
+            EventFactory(incident=incident)
         event_pks = list(incident.events.all().values_list("pk", flat=True))
 
-        response = self.client.get(path=f"/api/v1/incidents/{incident.pk}/events/")
+        # The number of queries must not grow with the number of events
+        with self.assertNumQueries(2):
+            response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident.pk}/events/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_pks = [ack["pk"] for ack in response.data]
@@ -199,7 +255,7 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
     def test_can_get_specific_event_of_incident(self):
         incident = self.add_open_incident_with_start_event_and_tag()
         event_pk = incident.events.first().pk
-        response = self.client.get(path=f"/api/v1/incidents/{incident.pk}/events/{event_pk}/")
+        response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident.pk}/events/{event_pk}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["pk"], event_pk)
 
@@ -210,15 +266,20 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
             "type": "OTH",
             "description": "event",
         }
-        response = self.client.post(path=f"/api/v1/incidents/{incident.pk}/events/", data=data, format="json")
+        response = self.post_json(f"/api/{self.api_version}/incidents/{incident.pk}/events/", data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(incident.events.filter(id=response.data["pk"]).exists())
 
     def test_can_get_all_tags_of_incident(self):
         incident = self.add_open_incident_with_start_event_and_tag()
+        for value in ("c", "d"):
+            tag = Tag.objects.create(key="b", value=value)
+            IncidentTagRelation.objects.create(incident=incident, tag=tag, added_by=self.user)
         tags = [str(relation.tag) for relation in incident.incident_tag_relations.all()]
 
-        response = self.client.get(path=f"/api/v1/incidents/{incident.pk}/tags/")
+        # The number of queries must not grow with the number of tags
+        with self.assertNumQueries(3):
+            response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident.pk}/tags/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_tags = [tag["tag"] for tag in response.data]
@@ -227,7 +288,7 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
     def test_can_get_specific_tag_of_incident(self):
         incident = self.add_open_incident_with_start_event_and_tag()
         tag = incident.incident_tag_relations.first().tag
-        response = self.client.get(path=f"/api/v1/incidents/{incident.pk}/tags/{tag}/")
+        response = self.client.get(path=f"/api/{self.api_version}/incidents/{incident.pk}/tags/{tag}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["tag"], str(tag))
 
@@ -237,7 +298,7 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
             "tag": "c=d",
         }
 
-        response = self.client.post(path=f"/api/v1/incidents/{incident.pk}/tags/", data=data, format="json")
+        response = self.post_json(f"/api/{self.api_version}/incidents/{incident.pk}/tags/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         incident_tags = [str(relation.tag) for relation in IncidentTagRelation.objects.filter(incident=incident)]
@@ -247,25 +308,26 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
         incident = self.add_open_incident_with_start_event_and_tag()
         tag = incident.incident_tag_relations.first().tag
 
-        response = self.client.delete(path=f"/api/v1/incidents/{incident.pk}/tags/{tag}/")
+        response = self.client.delete(path=f"/api/{self.api_version}/incidents/{incident.pk}/tags/{tag}/")
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertFalse(Tag.objects.filter(pk=tag.pk).exists())
 
     def test_can_create_ticket_url_of_incident(self):
-        incident_pk = self.add_open_incident_with_start_event_and_tag().pk
+        incident = self.add_open_incident_with_start_event_and_tag()
         data = {
             "ticket_url": "www.example.com",
         }
-        response = self.client.put(path=f"/api/v1/incidents/{incident_pk}/ticket_url/", data=data, format="json")
+        response = self.put_json(f"/api/{self.api_version}/incidents/{incident.pk}/ticket_url/", data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(Incident.objects.get(id=incident_pk).ticket_url, data["ticket_url"])
+        incident.refresh_from_db()
+        self.assertEqual(incident.ticket_url, data["ticket_url"])
 
     def test_can_get_my_incidents(self):
         incident_pk = self.add_open_incident_with_start_event_and_tag().pk
         other_incident_pk = StatefulIncidentFactory().pk
 
-        response = self.client.get(path="/api/v1/incidents/mine/")
+        response = self.client.get(path=f"/api/{self.api_version}/incidents/mine/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Paging, so check "results"
@@ -274,40 +336,28 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
         self.assertNotIn(other_incident_pk, response_pks)
 
     def test_can_create_my_incident_with_tag(self):
-        # Minimal data to post that has tags
-        data = {
-            "start_time": "2021-08-04T09:13:55.908Z",
-            "end_time": "2021-08-04T09:13:55.908Z",
-            "description": "incident",
-            "level": 1,
-            "tags": [{"tag": "a=b"}],
-        }
-
-        response = self.client.post(path="/api/v1/incidents/mine/", data=data, format="json")
+        data = INCIDENT_DATA
+        response = self.post_json(f"/api/{self.api_version}/incidents/mine/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        # Check that we have made the correct Incident
-        self.assertTrue(Incident.objects.filter(id=response.data["pk"]).exists())
-        incident = Incident.objects.get(id=response.data["pk"])
-        # Check that we have made the correct Tag
-        tag = data["tags"][0]["tag"]
-        key, value = Tag.split(tag)
-        self.assertTrue(Tag.objects.filter(key=key, value=value).exists())
-        tag = Tag.objects.get(key=key, value=value)
-        # Check that incident and tag are linked
-        self.assertTrue(IncidentTagRelation.objects.filter(incident=incident).filter(tag=tag).exists())
+        # Check that we have made the correct Incident, linked to the correct Tag
+        incident = Incident.objects.prefetch_related("incident_tag_relations__tag").get(id=response.data["pk"])
+        self.assertEqual(incident.description, data["description"])
+        incident_tags = [str(relation.tag) for relation in incident.incident_tag_relations.all()]
+        self.assertEqual(incident_tags, [data["tags"][0]["tag"]])
 
     def test_can_get_all_source_types(self):
-        source_type_names = set([type.name for type in SourceSystemType.objects.all()])
+        source_type_names = set(SourceSystemType.objects.values_list("name", flat=True))
 
-        response = self.client.get(path=f"/api/v1/incidents/source-types/")
+        with self.assertNumQueries(1):
+            response = self.client.get(path=f"/api/{self.api_version}/incidents/source-types/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response_types = set([type["name"] for type in response.data])
+        response_types = {type["name"] for type in response.data}
         self.assertEqual(response_types, source_type_names)
 
     def test_can_get_specific_source_type(self):
-        response = self.client.get(path=f"/api/v1/incidents/source-types/{self.source.type.name}/")
+        response = self.client.get(path=f"/api/{self.api_version}/incidents/source-types/{self.source.type.name}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["name"], self.source.type.name)
 
@@ -315,21 +365,27 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
         data = {
             "name": "test",
         }
-        response = self.client.post(path=f"/api/v1/incidents/source-types/", data=data, format="json")
+        response = self.post_json(f"/api/{self.api_version}/incidents/source-types/", data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(SourceSystemType.objects.filter(name=data["name"]).exists())
 
     def test_can_get_all_source_systems(self):
-        source_pks = set([source.pk for source in SourceSystem.objects.all()])
+        source_type = SourceSystemType.objects.create(name="other type")
+        # A random username could be the one of self.user, which already has a source
+        user = SourceUserFactory(username="other source user")
+        SourceSystem.objects.create(name="other source", type=source_type, user=user)
+        source_pks = set(SourceSystem.objects.values_list("pk", flat=True))
 
-        response = self.client.get(path=f"/api/v1/incidents/sources/")
+        # The number of queries must not grow with the number of sources
+        with self.assertNumQueries(1):
+            response = self.client.get(path=f"/api/{self.api_version}/incidents/sources/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response_source_pks = set([source["pk"] for source in response.data])
+        response_source_pks = {source["pk"] for source in response.data}
         self.assertEqual(response_source_pks, source_pks)
 
     def test_can_get_specific_source_system(self):
-        response = self.client.get(path=f"/api/v1/incidents/sources/{self.source.pk}/")
+        response = self.client.get(path=f"/api/{self.api_version}/incidents/sources/{self.source.pk}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["pk"], self.source.pk)
 
@@ -340,7 +396,7 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
             "name": "newtest",
             "type": self.source.type.name,
         }
-        response = self.client.post(path=f"/api/v1/incidents/sources/", data=data, format="json")
+        response = self.post_json(f"/api/{self.api_version}/incidents/sources/", data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(SourceSystem.objects.filter(name=data["name"]).exists())
 
@@ -350,9 +406,29 @@ class IncidentViewSetV1TestCase(IncidentAPITestCase):
         data = {
             "name": "newname",
         }
-        response = self.client.put(path=f"/api/v1/incidents/sources/{self.source.pk}/", data=data, format="json")
+        response = self.put_json(f"/api/{self.api_version}/incidents/sources/{self.source.pk}/", data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(SourceSystem.objects.get(id=self.source.pk).name, data["name"])
+        self.source.refresh_from_db()
+        self.assertEqual(self.source.name, data["name"])
+
+
+class IncidentViewSetV1TestCase(IncidentViewSetTestsMixin, IncidentAPITestCase):
+    api_version = "v1"
+
+    def test_can_create_acknowledgement_of_incident(self):
+        incident = self.add_open_incident_with_start_event_and_tag()
+        data = {
+            "event": {
+                "timestamp": "2022-08-02T13:04:03.529Z",
+                "type": "STA",
+                "description": "acknowledgement",
+            },
+            "expiration": "2022-08-03T13:04:03.529Z",
+        }
+        response = self.post_json(f"/api/v1/incidents/{incident.pk}/acks/", data)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(incident.events.filter(id=response.data["pk"]).exists())
+        self.assertTrue(Acknowledgement.objects.filter(event_id=response.data["pk"]).exists())
 
 
 class IncidentFilterByOpenAndStatefulV1TestCase(IncidentAPITestCase):
@@ -424,41 +500,57 @@ class IncidentFilterByFilterPkTestCase(IncidentAPITestCase):
         self.assertFalse(response.data["results"])
 
 
-class IncidentViewSetTestCase(APITestCase):
-    def setUp(self):
-        disconnect_signals()
-        source_type = SourceSystemTypeFactory()
-        self.user = SourceUserFactory()
-        self.source = SourceSystemFactory(type=source_type, user=self.user)
-        self.admin = AdminUserFactory()
-        self.client.force_authenticate(user=self.user)
-
-    def teardown(self):
-        connect_signals()
-
-    def add_open_incident_with_start_event_and_tag(self, description="incident"):
-        incident = StatefulIncidentFactory(source=self.source, description=description)
-        tag = TagFactory(key="a", value="b")
-        IncidentTagRelationFactory(incident=incident, tag=tag)
-        incident.create_first_event()
-        return incident
+class IncidentViewSetTestCase(IncidentViewSetTestsMixin, IncidentAPITestCase):
+    api_version = "v2"
 
     def add_event(self, incident_pk, description="event", type=Event.Type.OTHER):
         return EventFactory(incident_id=incident_pk, description=description, type=type)
 
-    def add_acknowledgement_with_incident_and_event(self):
-        return AcknowledgementFactory()
-
-    def test_can_get_all_incidents(self):
-        self.add_open_incident_with_start_event_and_tag()
-        incident_pks = list(Incident.objects.all().values_list("pk", flat=True))
-
-        response = self.client.get(path="/api/v2/incidents/")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Paging, so check "results"
-        response_pks = [incident["pk"] for incident in response.data["results"]]
-        self.assertEqual(response_pks, incident_pks)
+    def add_open_incidents_with_start_event_and_tag(self, *descriptions):
+        """Creates an open incident per pair of incident and event description, in bulk where possible
+
+        Each incident gets a start event, an event with the given event description and the tag "a=b".
+        """
+        timestamp = now()
+        incidents = Incident.objects.bulk_create(
+            Incident(
+                start_time=timestamp,
+                end_time=INFINITY_REPR,
+                source=self.source,
+                description=incident_description,
+            )
+            for incident_description, _ in descriptions
+        )
+        events = []
+        for incident, (incident_description, event_description) in zip(incidents, descriptions):
+            events.append(
+                Event(
+                    incident=incident,
+                    actor=self.user,
+                    timestamp=timestamp,
+                    type=Event.Type.INCIDENT_START,
+                    description=incident_description,
+                )
+            )
+            events.append(
+                Event(
+                    incident=incident,
+                    actor=self.user,
+                    timestamp=timestamp,
+                    type=Event.Type.OTHER,
+                    description=event_description,
+                )
+            )
+        Event.objects.bulk_create(events)
+        # Normally kept up to date by Event.save(), which bulk_create() does not call
+        for incident in incidents:
+            incident.search_text = incident.generate_search_text()
+        Incident.objects.bulk_update(incidents, ["search_text"])
+        tag, _ = Tag.objects.get_or_create(key="a", value="b")
+        IncidentTagRelation.objects.bulk_create(
+            IncidentTagRelation(incident=incident, tag=tag, added_by=self.user) for incident in incidents
+        )
+        return incidents
 
     def test_can_get_incident_by_incident_description(self):
         pk = self.add_open_incident_with_start_event_and_tag(description="incident1").pk
@@ -482,105 +574,32 @@ class IncidentViewSetTestCase(APITestCase):
         self.assertEqual(response.data["results"], [])
 
     def test_can_get_incident_by_incident_description_and_event_description(self):
-        incident_pk = self.add_open_incident_with_start_event_and_tag(description="incident1").pk
-        self.add_event(incident_pk=incident_pk, description="event")
-        self.add_open_incident_with_start_event_and_tag(description="incident2")
-        self.add_event(incident_pk=incident_pk, description="event")
+        incident, _ = self.add_open_incidents_with_start_event_and_tag(("incident1", "event"), ("incident2", "other"))
         response = self.client.get(path="/api/v2/incidents/?search=incident1,event")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["results"][0]["pk"], incident_pk)
+        self.assertEqual(response.data["results"][0]["pk"], incident.pk)
 
     def test_can_get_multiple_incidents_by_incident_description(self):
-        incident_pk1 = self.add_open_incident_with_start_event_and_tag(description="incident1").pk
-        incident_pk2 = self.add_open_incident_with_start_event_and_tag(description="incident2").pk
-        self.add_event(incident_pk=incident_pk1, description="event1")
-        self.add_event(incident_pk=incident_pk2, description="event2")
-        response = self.client.get(path="/api/v2/incidents/?search=incident")
+        incidents = self.add_open_incidents_with_start_event_and_tag(("incident1", "event1"), ("incident2", "event2"))
+        # Searching must not add queries per found incident
+        with self.assertNumQueries(5):
+            response = self.client.get(path="/api/v2/incidents/?search=incident")
         response_pks = set([incident["pk"] for incident in response.data["results"]])
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response_pks, set([incident_pk1, incident_pk2]))
+        self.assertEqual(response_pks, set([incident.pk for incident in incidents]))
 
     def test_can_get_multiple_incidents_by_incident_description_and_event_description(self):
-        incident_pk1 = self.add_open_incident_with_start_event_and_tag(description="target_incident").pk
-        incident_pk2 = self.add_open_incident_with_start_event_and_tag(description="incident2").pk
-        self.add_event(incident_pk=incident_pk1, description="event1")
-        self.add_event(incident_pk=incident_pk2, description="target_event")
+        incidents = self.add_open_incidents_with_start_event_and_tag(
+            ("target_incident", "event1"), ("incident2", "target_event")
+        )
         response = self.client.get(path="/api/v2/incidents/?search=target")
         response_pks = set([incident["pk"] for incident in response.data["results"]])
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response_pks, set([incident_pk1, incident_pk2]))
-
-    def test_can_get_specific_incident(self):
-        incident_pk = self.add_open_incident_with_start_event_and_tag().pk
-        response = self.client.get(path=f"/api/v2/incidents/{incident_pk}/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["pk"], incident_pk)
-
-    def test_can_create_incident_with_tag(self):
-        # Minimal data to post that has tags
-        data = {
-            "start_time": "2021-08-04T09:13:55.908Z",
-            "end_time": "2021-08-04T09:13:55.908Z",
-            "description": "incident",
-            "level": 1,
-            "tags": [{"tag": "a=b"}],
-        }
-
-        response = self.client.post(path="/api/v2/incidents/", data=data, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        # Check that we have made the correct Incident
-        self.assertTrue(Incident.objects.filter(id=response.data["pk"]).exists())
-        incident = Incident.objects.get(id=response.data["pk"])
-        # Check that we have made the correct Tag
-        tag = data["tags"][0]["tag"]
-        key, value = Tag.split(tag)
-        self.assertTrue(Tag.objects.filter(key=key, value=value).exists())
-        tag = Tag.objects.get(key=key, value=value)
-        # Check that incident and tag are linked
-        self.assertTrue(IncidentTagRelation.objects.filter(incident=incident).filter(tag=tag).exists())
-
-    def test_can_update_incident_level(self):
-        incident_pk = self.add_open_incident_with_start_event_and_tag().pk
-        incident_path = reverse("v2:incident:incident-detail", args=[incident_pk])
-        response = self.client.patch(
-            path=incident_path,
-            data={
-                "level": 2,
-            },
-        )
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(Incident.objects.get(pk=incident_pk).level, 2)
-
-    def test_can_get_all_acknowledgements_of_incident(self):
-        ack = self.add_acknowledgement_with_incident_and_event()
-        incident = ack.event.incident
-        ack_pks = list(incident.acks.all().values_list("pk", flat=True))
-
-        response = self.client.get(path=f"/api/v2/incidents/{incident.pk}/acks/")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response_pks = [ack["pk"] for ack in response.data]
-        self.assertEqual(response_pks, ack_pks)
-        event_types = [ack["event"]["type"]["value"] for ack in response.data]
-        self.assertEqual(set(event_types), {"ACK"})
-
-    def test_can_get_specific_acknowledgement_of_incident(self):
-        ack = self.add_acknowledgement_with_incident_and_event()
-        incident_pk = ack.event.incident.pk
-        response = self.client.get(path=f"/api/v2/incidents/{incident_pk}/acks/{ack.pk}/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["event"]["pk"], ack.pk)
-        self.assertEqual(response.data["event"]["type"]["value"], "ACK")
+        self.assertEqual(response_pks, set([incident.pk for incident in incidents]))
 
     def test_can_create_acknowledgement_of_incident(self):
         incident = self.add_open_incident_with_start_event_and_tag()
-        data = {
-            "timestamp": "2022-08-02T13:04:03.529Z",
-            "description": "acknowledgement",
-            "expiration": "2022-08-03T13:04:03.529Z",
-        }
-        response = self.client.post(path=f"/api/v2/incidents/{incident.pk}/acks/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/{incident.pk}/acks/", ACK_DATA)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(incident.events.filter(id=response.data["pk"]).exists())
         self.assertTrue(Acknowledgement.objects.filter(event_id=response.data["pk"]).exists())
@@ -592,92 +611,23 @@ class IncidentViewSetTestCase(APITestCase):
             "description": "",
             "expiration": "2022-08-03T13:04:03.529Z",
         }
-        response = self.client.post(path=f"/api/v2/incidents/{incident.pk}/acks/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/{incident.pk}/acks/", data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(incident.events.filter(id=response.data["pk"]).exists())
-        self.assertTrue(Acknowledgement.objects.filter(event_id=response.data["pk"]).exists())
-        self.assertEqual(Acknowledgement.objects.get(event_id=response.data["pk"]).event.description, "")
+        ack = Acknowledgement.objects.get(event_id=response.data["pk"])
+        self.assertEqual(ack.event.description, "")
 
     def test_can_create_acknowledgement_of_incident_without_description_and_expiration(self):
         incident = self.add_open_incident_with_start_event_and_tag()
         data = {
             "timestamp": "2022-08-02T13:04:03.529Z",
         }
-        response = self.client.post(path=f"/api/v2/incidents/{incident.pk}/acks/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/{incident.pk}/acks/", data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(incident.events.filter(id=response.data["pk"]).exists())
-        self.assertTrue(Acknowledgement.objects.filter(event_id=response.data["pk"]).exists())
-        self.assertEqual(Acknowledgement.objects.get(event_id=response.data["pk"]).event.description, "")
-        self.assertEqual(Acknowledgement.objects.get(event_id=response.data["pk"]).expiration, None)
-
-    def test_can_update_acknowledgement_of_incident(self):
-        ack = self.add_acknowledgement_with_incident_and_event()
-        incident = ack.event.incident
-        data = {
-            "expiration": (now() + datetime.timedelta(days=3)).isoformat(),
-        }
-        response = self.client.put(path=f"/api/v2/incidents/{incident.pk}/acks/{ack.pk}/", data=data)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            incident.events.get(pk=ack.pk).ack.expiration, datetime.datetime.fromisoformat(data["expiration"])
-        )
-
-    def test_can_get_all_events_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        event_pks = list(incident.events.all().values_list("pk", flat=True))
-
-        response = self.client.get(path=f"/api/v2/incidents/{incident.pk}/events/")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response_pks = [ack["pk"] for ack in response.data]
-        self.assertEqual(response_pks, event_pks)
-
-    def test_can_get_specific_event_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        event_pk = incident.events.first().pk
-        response = self.client.get(path=f"/api/v2/incidents/{incident.pk}/events/{event_pk}/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["pk"], event_pk)
-
-    def test_can_create_event_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        data = {
-            "timestamp": "2022-08-02T13:45:44.056Z",
-            "type": "OTH",
-            "description": "event",
-        }
-        response = self.client.post(path=f"/api/v2/incidents/{incident.pk}/events/", data=data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(incident.events.filter(id=response.data["pk"]).exists())
-
-    def test_can_get_all_tags_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        tags = [str(relation.tag) for relation in incident.incident_tag_relations.all()]
-
-        response = self.client.get(path=f"/api/v2/incidents/{incident.pk}/tags/")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response_tags = [tag["tag"] for tag in response.data]
-        self.assertEqual(response_tags, tags)
-
-    def test_can_get_specific_tag_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        tag = incident.incident_tag_relations.first().tag
-        response = self.client.get(path=f"/api/v2/incidents/{incident.pk}/tags/{tag}/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["tag"], str(tag))
-
-    def test_can_create_tag_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        data = {
-            "tag": "c=d",
-        }
-
-        response = self.client.post(path=f"/api/v2/incidents/{incident.pk}/tags/", data=data, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        incident_tags = [str(relation.tag) for relation in IncidentTagRelation.objects.filter(incident=incident)]
-        self.assertIn(data["tag"], incident_tags)
+        ack = Acknowledgement.objects.get(event_id=response.data["pk"])
+        self.assertEqual(ack.event.description, "")
+        self.assertEqual(ack.expiration, None)
 
     def test_cannot_create_tag_of_incident_with_invalid_key(self):
         incident = self.add_open_incident_with_start_event_and_tag()
@@ -685,30 +635,12 @@ class IncidentViewSetTestCase(APITestCase):
             "tag": "???=d",
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/{incident.pk}/tags/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/{incident.pk}/tags/", data)
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         incident_tags = [str(relation.tag) for relation in IncidentTagRelation.objects.filter(incident=incident)]
         self.assertNotIn(data["tag"], incident_tags)
 
-    def test_can_delete_tag_of_incident(self):
-        incident = self.add_open_incident_with_start_event_and_tag()
-        tag = incident.incident_tag_relations.first().tag
-
-        response = self.client.delete(path=f"/api/v2/incidents/{incident.pk}/tags/{tag}/")
-
-        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Tag.objects.filter(pk=tag.pk).exists())
-
-    def test_can_create_ticket_url_of_incident(self):
-        incident_pk = self.add_open_incident_with_start_event_and_tag().pk
-        data = {
-            "ticket_url": "www.example.com",
-        }
-        response = self.client.put(path=f"/api/v2/incidents/{incident_pk}/ticket_url/", data=data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(Incident.objects.get(id=incident_pk).ticket_url, data["ticket_url"])
-
     def test_can_get_existing_ticket_url_of_incident(self):
         ticket_url = "www.example.com"
         pk = StatefulIncidentFactory(ticket_url=ticket_url).pk
@@ -716,42 +648,6 @@ class IncidentViewSetTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["ticket_url"], ticket_url)
 
-    def test_can_get_my_incidents(self):
-        incident_pk = self.add_open_incident_with_start_event_and_tag().pk
-        other_incident_pk = StatefulIncidentFactory().pk
-
-        response = self.client.get(path="/api/v2/incidents/mine/")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Paging, so check "results"
-        response_pks = [incident["pk"] for incident in response.data["results"]]
-        self.assertIn(incident_pk, response_pks)
-        self.assertNotIn(other_incident_pk, response_pks)
-
-    def test_can_create_my_incident_with_tag(self):
-        # Minimal data to post that has tags
-        data = {
-            "start_time": "2021-08-04T09:13:55.908Z",
-            "end_time": "2021-08-04T09:13:55.908Z",
-            "description": "incident",
-            "level": 1,
-            "tags": [{"tag": "a=b"}],
-        }
-
-        response = self.client.post(path="/api/v2/incidents/mine/", data=data, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        # Check that we have made the correct Incident
-        self.assertTrue(Incident.objects.filter(id=response.data["pk"]).exists())
-        incident = Incident.objects.get(id=response.data["pk"])
-        # Check that we have made the correct Tag
-        tag = data["tags"][0]["tag"]
-        key, value = Tag.split(tag)
-        self.assertTrue(Tag.objects.filter(key=key, value=value))
-        tag = Tag.objects.get(key=key, value=value)
-        # Check that incident and tag are linked
-        self.assertTrue(IncidentTagRelation.objects.filter(incident=incident).filter(tag=tag).exists())
-
     def test_can_get_all_events(self):
         self.add_open_incident_with_start_event_and_tag()
         event_pks = list(Event.objects.all().values_list("pk", flat=True))
@@ -763,87 +659,21 @@ class IncidentViewSetTestCase(APITestCase):
         response_pks = [ack["pk"] for ack in response.data["results"]]
         self.assertEqual(response_pks, event_pks)
 
-    def test_can_get_all_source_types(self):
-        source_type_names = set([type.name for type in SourceSystemType.objects.all()])
-
-        response = self.client.get(path=f"/api/v2/incidents/source-types/")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response_types = set([type["name"] for type in response.data])
-        self.assertEqual(response_types, source_type_names)
-
-    def test_can_get_specific_source_type(self):
-        response = self.client.get(path=f"/api/v2/incidents/source-types/{self.source.type.name}/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["name"], self.source.type.name)
-
-    def test_can_create_source_type(self):
-        data = {
-            "name": "test",
-        }
-        response = self.client.post(path=f"/api/v2/incidents/source-types/", data=data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(SourceSystemType.objects.filter(name=data["name"]).exists())
-
-    def test_can_get_all_source_systems(self):
-        source_pks = set([source.pk for source in SourceSystem.objects.all()])
-
-        response = self.client.get(path=f"/api/v2/incidents/sources/")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        response_source_pks = set([source["pk"] for source in response.data])
-        self.assertEqual(response_source_pks, source_pks)
-
-    def test_can_get_specific_source_system(self):
-        response = self.client.get(path=f"/api/v2/incidents/sources/{self.source.pk}/")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["pk"], self.source.pk)
-
-    def test_can_create_source_system(self):
-        # Only admins can create sources
-        self.client.force_authenticate(user=self.admin)
-        data = {
-            "name": "newtest",
-            "type": self.source.type.name,
-        }
-        response = self.client.post(path=f"/api/v2/incidents/sources/", data=data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(SourceSystem.objects.filter(name=data["name"]).exists())
-
-    def test_can_update_source_system(self):
-        # Only admins can update sources
-        self.client.force_authenticate(user=self.admin)
-        data = {
-            "name": "newname",
-        }
-        response = self.client.put(path=f"/api/v2/incidents/sources/{self.source.pk}/", data=data, format="json")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(SourceSystem.objects.get(id=self.source.pk).name, data["name"])
-
-
-class BulkAcknowledgementViewSetTestCase(APITestCase):
+class BulkAcknowledgementViewSetTestCase(JSONAPITestCase):
     def setUp(self):
-        disconnect_signals()
         self.user = BaseUserFactory(username="user1")
         self.client.force_authenticate(user=self.user)
-        self.ack_data = {
-            "timestamp": "2022-08-02T13:04:03.529Z",
-            "description": "acknowledgement",
-            "expiration": "2022-08-03T13:04:03.529Z",
-        }
-
-    def tearDown(self):
-        connect_signals()
 
     def test_can_bulk_create_acknowledgements_for_incidents_with_valid_ids(self):
         incident_1 = StatefulIncidentFactory()
         incident_2 = StatefulIncidentFactory()
         data = {
             "ids": [incident_1.pk, incident_2.pk],
-            "ack": self.ack_data,
+            "ack": ACK_DATA,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/acks/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/acks/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -870,7 +700,7 @@ class BulkAcknowledgementViewSetTestCase(APITestCase):
             },
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/acks/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/acks/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -902,7 +732,7 @@ class BulkAcknowledgementViewSetTestCase(APITestCase):
             },
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/acks/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/acks/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -922,15 +752,16 @@ class BulkAcknowledgementViewSetTestCase(APITestCase):
         self.assertTrue(incident_2.events.filter(type="ACK").exists())
 
     def test_cannot_bulk_create_acknowledgements_for_incidents_with_all_invalid_ids(self):
-        highest_incident_pk = Incident.objects.last().id if Incident.objects.exists() else 0
+        # Incidents are ordered by start time, so last() is not necessarily the one with the highest pk
+        highest_incident_pk = Incident.objects.aggregate(Max("pk"))["pk__max"] or 0
         invalid_incident_1_pk = highest_incident_pk + 1
         invalid_incident_2_pk = highest_incident_pk + 2
         data = {
             "ids": [invalid_incident_1_pk, invalid_incident_2_pk],
-            "ack": self.ack_data,
+            "ack": ACK_DATA,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/acks/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/acks/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -949,14 +780,13 @@ class BulkAcknowledgementViewSetTestCase(APITestCase):
 
     def test_can_partially_bulk_create_acknowledgements_for_incidents_with_some_valid_ids(self):
         incident_1 = StatefulIncidentFactory()
-        highest_incident_pk = Incident.objects.last().id
-        invalid_incident_2_pk = highest_incident_pk + 1
+        invalid_incident_2_pk = incident_1.pk + 1
         data = {
             "ids": [incident_1.pk, invalid_incident_2_pk],
-            "ack": self.ack_data,
+            "ack": ACK_DATA,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/acks/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/acks/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -974,29 +804,20 @@ class BulkAcknowledgementViewSetTestCase(APITestCase):
         self.assertFalse(Acknowledgement.objects.filter(event__incident_id=invalid_incident_2_pk).exists())
 
 
-class BulkEventViewSetTestCase(APITestCase):
+class BulkEventViewSetTestCase(JSONAPITestCase):
     def setUp(self):
-        disconnect_signals()
         self.user = BaseUserFactory(username="user1")
         self.client.force_authenticate(user=self.user)
-        self.event_data = {
-            "timestamp": "2022-08-02T13:04:03.529Z",
-            "description": "event",
-            "type": "OTH",
-        }
-
-    def tearDown(self):
-        connect_signals()
 
     def test_can_bulk_create_events_for_incidents_with_valid_ids(self):
         incident_1 = StatefulIncidentFactory()
         incident_2 = StatefulIncidentFactory()
         data = {
             "ids": [incident_1.pk, incident_2.pk],
-            "event": self.event_data,
+            "event": EVENT_DATA,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/events/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/events/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -1024,7 +845,7 @@ class BulkEventViewSetTestCase(APITestCase):
             },
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/events/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/events/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -1055,7 +876,7 @@ class BulkEventViewSetTestCase(APITestCase):
             },
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/events/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/events/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -1086,7 +907,7 @@ class BulkEventViewSetTestCase(APITestCase):
             },
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/events/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/events/bulk/", data)
 
         incident_1.refresh_from_db()
         incident_2.refresh_from_db()
@@ -1121,7 +942,7 @@ class BulkEventViewSetTestCase(APITestCase):
             },
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/events/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/events/bulk/", data)
 
         incident_1.refresh_from_db()
         incident_2.refresh_from_db()
@@ -1147,15 +968,15 @@ class BulkEventViewSetTestCase(APITestCase):
         self.assertTrue(incident_2.open)
 
     def test_cannot_bulk_create_events_for_incidents_with_all_invalid_ids(self):
-        highest_incident_pk = Incident.objects.last().id if Incident.objects.exists() else 0
+        highest_incident_pk = Incident.objects.aggregate(Max("pk"))["pk__max"] or 0
         invalid_incident_1_pk = highest_incident_pk + 1
         invalid_incident_2_pk = highest_incident_pk + 2
         data = {
             "ids": [invalid_incident_1_pk, invalid_incident_2_pk],
-            "event": self.event_data,
+            "event": EVENT_DATA,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/events/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/events/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -1174,14 +995,13 @@ class BulkEventViewSetTestCase(APITestCase):
 
     def test_can_partially_bulk_create_events_for_incidents_with_some_valid_ids(self):
         incident_1 = StatefulIncidentFactory()
-        highest_incident_pk = Incident.objects.last().id
-        invalid_incident_2_pk = highest_incident_pk + 1
+        invalid_incident_2_pk = incident_1.pk + 1
         data = {
             "ids": [incident_1.pk, invalid_incident_2_pk],
-            "event": self.event_data,
+            "event": EVENT_DATA,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/events/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/events/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -1199,16 +1019,12 @@ class BulkEventViewSetTestCase(APITestCase):
         self.assertFalse(Event.objects.filter(incident_id=invalid_incident_2_pk).exists())
 
 
-class BulkTicketUrlViewSetTestCase(APITestCase):
+class BulkTicketUrlViewSetTestCase(JSONAPITestCase):
     def setUp(self):
-        disconnect_signals()
         self.user = BaseUserFactory(username="user1")
         self.client.force_authenticate(user=self.user)
         self.ticket_url = "www.example.com"
 
-    def tearDown(self):
-        connect_signals()
-
     def test_can_bulk_set_ticket_url_for_incidents_with_valid_ids(self):
         incident_1 = StatefulIncidentFactory()
         incident_2 = StatefulIncidentFactory()
@@ -1217,7 +1033,7 @@ class BulkTicketUrlViewSetTestCase(APITestCase):
             "ticket_url": self.ticket_url,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/ticket_url/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/ticket_url/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -1237,7 +1053,7 @@ class BulkTicketUrlViewSetTestCase(APITestCase):
         self.assertEqual(incident_2.ticket_url, data["ticket_url"])
 
     def test_cannot_bulk_set_ticket_url_for_incidents_with_all_invalid_ids(self):
-        highest_incident_pk = Incident.objects.last().id if Incident.objects.exists() else 0
+        highest_incident_pk = Incident.objects.aggregate(Max("pk"))["pk__max"] or 0
         invalid_incident_1_pk = highest_incident_pk + 1
         invalid_incident_2_pk = highest_incident_pk + 2
         data = {
@@ -1245,7 +1061,7 @@ class BulkTicketUrlViewSetTestCase(APITestCase):
             "ticket_url": self.ticket_url,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/ticket_url/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/ticket_url/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
@@ -1261,14 +1077,13 @@ class BulkTicketUrlViewSetTestCase(APITestCase):
 
     def test_can_partially_bulk_set_ticket_url_for_incidents_with_some_valid_ids(self):
         incident_1 = StatefulIncidentFactory()
-        highest_incident_pk = Incident.objects.last().id
-        invalid_incident_2_pk = highest_incident_pk + 1
+        invalid_incident_2_pk = incident_1.pk + 1
         data = {
             "ids": [incident_1.pk, invalid_incident_2_pk],
             "ticket_url": self.ticket_url,
         }
 
-        response = self.client.post(path=f"/api/v2/incidents/ticket_url/bulk/", data=data, format="json")
+        response = self.post_json(f"/api/v2/incidents/ticket_url/bulk/", data)
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -10,15 +10,23 @@ from argus.notificationprofile.serializers import RequestDestinationConfigSerial
 from argus.util.testing import connect_signals, disconnect_signals
 
 
+REQUEST_FACTORY = APIRequestFactory()
+# Validated settings, pass on copies since the serializer and model keep what they are given
+EMAIL_SETTINGS = {"email_address": "user@example.com", "synced": False}
+
+
 @tag("integration")
 class EmailDestinationConfigSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # The user never logs in, so skip hashing a password for it
+        cls.user = PersonUserFactory(password=None)
+
     def setUp(self):
-        self.user = PersonUserFactory()
-        self.request_factory = APIRequestFactory()
+        self.request = REQUEST_FACTORY.post("/")
+        self.request.user = self.user
 
     def test_email_destination_serializer_is_valid_with_correct_input(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "media": "email",
             "settings": {
@@ -27,55 +35,26 @@ class EmailDestinationConfigSerializerTests(TestCase):
         }
         serializer = RequestDestinationConfigSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertTrue(serializer.is_valid(), serializer.errors)
 
-    def test_email_destination_serializer_is_invalid_with_empty_settings(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
-        data = {
-            "media": "email",
-            "settings": {},
-        }
-        serializer = RequestDestinationConfigSerializer(
-            data=data,
-            context={"request": request},
-        )
-        self.assertFalse(serializer.is_valid())
-        self.assertTrue(serializer.errors)
-
-    def test_email_destination_serializer_is_invalid_with_missing_key(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
-        data = {
-            "media": "email",
-            "settings": {"phone_number": "+4747474747"},
-        }
-        serializer = RequestDestinationConfigSerializer(
-            data=data,
-            context={"request": request},
-        )
-        self.assertFalse(serializer.is_valid())
-        self.assertTrue(serializer.errors)
-
-    def test_email_destination_serializer_is_invalid_with_invalid_email_address(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
-        data = {
-            "media": "email",
-            "settings": {"email_address": "hello"},
+    def test_email_destination_serializer_is_invalid_with_invalid_settings(self):
+        invalid_settings = {
+            "empty settings": {},
+            "missing key": {"phone_number": "+4747474747"},
+            "invalid email address": {"email_address": "hello"},
         }
-        serializer = RequestDestinationConfigSerializer(
-            data=data,
-            context={"request": request},
-        )
-        self.assertFalse(serializer.is_valid())
-        self.assertTrue(serializer.errors)
+        for case, settings in invalid_settings.items():
+            with self.subTest(case=case):
+                serializer = RequestDestinationConfigSerializer(
+                    data={"media": "email", "settings": settings},
+                    context={"request": self.request},
+                )
+                self.assertFalse(serializer.is_valid())
+                self.assertTrue(serializer.errors)
 
     def test_email_destination_serializer_is_valid_with_additional_arguments(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "media": "email",
             "settings": {
@@ -85,52 +64,36 @@ class EmailDestinationConfigSerializerTests(TestCase):
         }
         serializer = RequestDestinationConfigSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertTrue(serializer.is_valid())
         self.assertEqual(
             serializer.validated_data["settings"],
-            {
-                "email_address": "user@example.com",
-                "synced": False,
-            },
+            EMAIL_SETTINGS,
         )
 
     def test_can_create_email_destination(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         validated_data = {
             "media_id": "email",
-            "settings": {
-                "email_address": "user@example.com",
-                "synced": False,
-            },
+            "settings": dict(EMAIL_SETTINGS),
             "user": self.user,
         }
         serializer = RequestDestinationConfigSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         obj = serializer.create(validated_data)
         self.assertEqual(
             obj.settings,
-            {
-                "email_address": "user@example.com",
-                "synced": False,
-            },
+            EMAIL_SETTINGS,
         )
 
     def test_can_update_email_destination(self):
-        destination = DestinationConfigFactory(
+        destination = DestinationConfig.objects.create(
             user=self.user,
             media_id="email",
-            settings={
-                "email_address": "user@example.com",
-                "synced": False,
-            },
+            settings=dict(EMAIL_SETTINGS),
         )
 
-        request = self.request_factory.post("/")
-        request.user = self.user
         validated_data = {
             "media_id": "email",
             "settings": {
@@ -140,14 +103,12 @@ class EmailDestinationConfigSerializerTests(TestCase):
             "user": self.user,
         }
         serializer = RequestDestinationConfigSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         obj = serializer.update(destination, validated_data)
         self.assertEqual(obj.settings["email_address"], "new.email@example.com")
 
     def test_email_destination_serializer_is_invalid_with_different_medium(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "media": "email",
             "settings": {
@@ -156,7 +117,7 @@ class EmailDestinationConfigSerializerTests(TestCase):
         }
         serializer = RequestDestinationConfigSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         serializer.is_valid()
         destination = serializer.save(user=self.user)
@@ -169,7 +130,7 @@ class EmailDestinationConfigSerializerTests(TestCase):
         second_serializer = RequestDestinationConfigSerializer(
             instance=destination,
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertFalse(second_serializer.is_valid())
         self.assertTrue(second_serializer.errors)
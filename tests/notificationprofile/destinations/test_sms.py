@@ -1,81 +1,63 @@
+import unittest
+
 from django.test import TestCase, tag
 from rest_framework import status
 from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 
 from argus.auth.factories import PersonUserFactory
 from argus.notificationprofile.factories import DestinationConfigFactory, NotificationProfileFactory
+from argus.notificationprofile.media import MEDIA_CLASSES_DICT
 from argus.notificationprofile.media.sms_as_email import SMSNotification
 from argus.notificationprofile.models import DestinationConfig, Media
 from argus.notificationprofile.serializers import RequestDestinationConfigSerializer
 from argus.util.testing import connect_signals, disconnect_signals
 
 
+REQUEST_FACTORY = APIRequestFactory()
+HAS_SMS = "sms" in MEDIA_CLASSES_DICT
+# Valid settings, pass on copies since the serializer and model keep what they are given
+SMS_SETTINGS = {"phone_number": "+4747474747"}
+
+
+@unittest.skipUnless(HAS_SMS, "No sms plugin available")
 @tag("integration")
 class SMSDestinationConfigSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # The user never logs in, so skip hashing a password for it
+        cls.user = PersonUserFactory(password=None)
+
     def setUp(self):
-        self.user = PersonUserFactory()
-        self.request_factory = APIRequestFactory()
+        self.request = REQUEST_FACTORY.post("/")
+        self.request.user = self.user
 
     def test_sms_destination_serializer_is_valid_with_correct_input(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "media": "sms",
-            "settings": {
-                "phone_number": "+4747474747",
-            },
+            "settings": dict(SMS_SETTINGS),
         }
         serializer = RequestDestinationConfigSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertTrue(serializer.is_valid(), serializer.errors)
 
-    def test_sms_destination_serializer_is_invalid_with_empty_settings(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
-        data = {
-            "media": "sms",
-            "settings": {},
-        }
-        serializer = RequestDestinationConfigSerializer(
-            data=data,
-            context={"request": request},
-        )
-        self.assertFalse(serializer.is_valid())
-        self.assertTrue(serializer.errors)
-
-    def test_sms_destination_serializer_is_invalid_with_missing_key(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
-        data = {
-            "media": "sms",
-            "settings": {"email_address": "user@example.com"},
-        }
-        serializer = RequestDestinationConfigSerializer(
-            data=data,
-            context={"request": request},
-        )
-        self.assertFalse(serializer.is_valid())
-        self.assertTrue(serializer.errors)
-
-    def test_email_destination_serializer_is_invalid_with_invalid_phone_number(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
-        data = {
-            "media": "sms",
-            "settings": {"phone_number": "+474747"},
+    def test_sms_destination_serializer_is_invalid_with_invalid_settings(self):
+        invalid_settings = {
+            "empty settings": {},
+            "missing key": {"email_address": "user@example.com"},
+            "invalid phone number": {"phone_number": "+474747"},
         }
-        serializer = RequestDestinationConfigSerializer(
-            data=data,
-            context={"request": request},
-        )
-        self.assertFalse(serializer.is_valid())
-        self.assertTrue(serializer.errors)
+        for case, settings in invalid_settings.items():
+            with self.subTest(case=case):
+                serializer = RequestDestinationConfigSerializer(
+                    data={"media": "sms", "settings": settings},
+                    context={"request": self.request},
+                )
+                self.assertFalse(serializer.is_valid())
+                self.assertTrue(serializer.errors)
 
     def test_email_destination_serializer_is_valid_with_additional_arguments(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "media": "sms",
             "settings": {
@@ -85,46 +67,36 @@ class SMSDestinationConfigSerializerTests(TestCase):
         }
         serializer = RequestDestinationConfigSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertTrue(serializer.is_valid())
         self.assertEqual(
             serializer.validated_data["settings"],
-            {
-                "phone_number": "+4747474747",
-            },
+            SMS_SETTINGS,
         )
 
     def test_can_create_sms_destination(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         validated_data = {
             "media_id": "sms",
-            "settings": {
-                "phone_number": "+4747474747",
-            },
+            "settings": dict(SMS_SETTINGS),
             "user": self.user,
         }
         serializer = RequestDestinationConfigSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         obj = serializer.create(validated_data)
         self.assertEqual(
             obj.settings,
-            {
-                "phone_number": "+4747474747",
-            },
+            SMS_SETTINGS,
         )
 
     def test_can_update_sms_destination(self):
-        destination = DestinationConfigFactory(
+        destination = DestinationConfig.objects.create(
             user=self.user,
             media_id="sms",
-            settings={"phone_number": "+4747474747"},
+            settings=dict(SMS_SETTINGS),
         )
 
-        request = self.request_factory.post("/")
-        request.user = self.user
         validated_data = {
             "media_id": "sms",
             "settings": {
@@ -133,23 +105,19 @@ class SMSDestinationConfigSerializerTests(TestCase):
             "user": self.user,
         }
         serializer = RequestDestinationConfigSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         obj = serializer.update(destination, validated_data)
         self.assertEqual(obj.settings["phone_number"], "+4711111111")
 
     def test_sms_destination_serializer_is_invalid_with_different_medium(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "media": "sms",
-            "settings": {
-                "phone_number": "+4747474747",
-            },
+            "settings": dict(SMS_SETTINGS),
         }
         serializer = RequestDestinationConfigSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         serializer.is_valid()
         destination = serializer.save(user=self.user)
@@ -162,12 +130,13 @@ class SMSDestinationConfigSerializerTests(TestCase):
         second_serializer = RequestDestinationConfigSerializer(
             instance=destination,
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertFalse(second_serializer.is_valid())
         self.assertTrue(second_serializer.errors)
 
 
+@unittest.skipUnless(HAS_SMS, "No sms plugin available")
 @tag("API", "integration")
 class SMSMediumViewTests(APITestCase):
     def setUp(self):
@@ -208,6 +177,7 @@ class SMSMediumViewTests(APITestCase):
         self.assertEqual(response.data["name"], "SMS")
 
 
+@unittest.skipUnless(HAS_SMS, "No sms plugin available")
 @tag("API", "integration")
 class SMSDestinationViewTests(APITestCase):
     ENDPOINT = "/api/v2/notificationprofiles/destinations/"
@@ -222,7 +192,7 @@ class SMSDestinationViewTests(APITestCase):
         self.sms_destination = DestinationConfigFactory(
             user=self.user1,
             media=Media.objects.get(slug="sms"),
-            settings={"phone_number": "+4747474747"},
+            settings=dict(SMS_SETTINGS),
         )
 
     def teardown(self):
@@ -317,6 +287,7 @@ class SMSDestinationViewTests(APITestCase):
         self.assertTrue(DestinationConfig.objects.filter(pk=self.sms_destination.pk).exists())
 
 
+@unittest.skipUnless(HAS_SMS, "No sms plugin available")
 @tag("integration")
 class SMSDestinationSendTests(TestCase):
     def setUp(self):
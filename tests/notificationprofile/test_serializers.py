@@ -12,17 +12,28 @@ from argus.notificationprofile.models import Timeslot
 from argus.notificationprofile.serializers import TimeslotSerializer
 
 
+REQUEST_FACTORY = APIRequestFactory()
+# Validated time recurrence data, the serializer does not modify it
+TIME_RECURRENCE_DATA = OrderedDict(
+    [("days", {1, 2, 3, 4, 5}), ("start", datetime.time(8, 0)), ("end", datetime.time(16, 0))]
+)
+
+
 @tag("integration")
 class TimeslotSerializerTests(TestCase):
-    def setUp(self):
-        self.user = PersonUserFactory()
+    @classmethod
+    def setUpTestData(cls):
+        # The user never logs in, so skip hashing a password for it
+        cls.user = PersonUserFactory(password=None)
         # When creating a User which is a person, we also create a default Timeslot
-        self.default_timeslot = Timeslot.objects.get(user=self.user)
-        self.request_factory = APIRequestFactory()
+        cls.default_timeslot = Timeslot.objects.get(user=cls.user)
+
+    def setUp(self):
+        # Attributes set in setUpTestData are deep-copied for every test, which costs more than a new request
+        self.request = REQUEST_FACTORY.post("/")
+        self.request.user = self.user
 
     def test_timeslot_serializer_is_valid_with_correct_input(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "name": "vfrgthj",
             "time_recurrences": [
@@ -35,13 +46,11 @@ class TimeslotSerializerTests(TestCase):
         }
         serializer = TimeslotSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertTrue(serializer.is_valid(), serializer.errors)
 
     def test_timeslot_serializer_is_invalid_with_duplicate_name(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         data = {
             "name": self.default_timeslot.name,
             "time_recurrences": [
@@ -54,40 +63,32 @@ class TimeslotSerializerTests(TestCase):
         }
         serializer = TimeslotSerializer(
             data=data,
-            context={"request": request},
+            context={"request": self.request},
         )
         self.assertFalse(serializer.is_valid())
         self.assertTrue(serializer.errors)
 
     def test_can_create_timeslot(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         validated_data = {
             "name": "vfrgthj",
-            "time_recurrences": [
-                OrderedDict([("days", {1, 2, 3, 4, 5}), ("start", datetime.time(8, 0)), ("end", datetime.time(16, 0))])
-            ],
+            "time_recurrences": [TIME_RECURRENCE_DATA],
             "user": self.user,
         }
         serializer = TimeslotSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         obj = serializer.create(validated_data)
         self.assertEqual(obj.name, "vfrgthj")
 
     def test_cannot_create_timeslot_with_duplicate_name(self):
-        request = self.request_factory.post("/")
-        request.user = self.user
         # Reuse the name of the default timeslot
         validated_data = {
             "name": self.default_timeslot.name,
-            "time_recurrences": [
-                OrderedDict([("days", {1, 2, 3, 4, 5}), ("start", datetime.time(8, 0)), ("end", datetime.time(16, 0))])
-            ],
+            "time_recurrences": [TIME_RECURRENCE_DATA],
             "user": self.user,
         }
         serializer = TimeslotSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         # serializer.create works on already validated data
         with self.assertRaises(IntegrityError):
@@ -95,35 +96,27 @@ class TimeslotSerializerTests(TestCase):
 
     def test_can_update_timeslot(self):
         timeslot = TimeslotFactory(name="existing name", user=self.user)
-        request = self.request_factory.post("/")
-        request.user = self.user
         validated_data = {
             "name": "new name",
-            "time_recurrences": [
-                OrderedDict([("days", {1, 2, 3, 4, 5}), ("start", datetime.time(8, 0)), ("end", datetime.time(16, 0))])
-            ],
+            "time_recurrences": [TIME_RECURRENCE_DATA],
             "user": self.user,
         }
         serializer = TimeslotSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         obj = serializer.update(timeslot, validated_data)
         self.assertEqual(obj.name, "new name")
 
     def test_cannot_update_timeslot_with_duplicate_name(self):
         timeslot = TimeslotFactory(name="existing name", user=self.user)
-        request = self.request_factory.post("/")
-        request.user = self.user
         # Reuse the name of the default timeslot
         validated_data = {
             "name": self.default_timeslot.name,
-            "time_recurrences": [
-                OrderedDict([("days", {1, 2, 3, 4, 5}), ("start", datetime.time(8, 0)), ("end", datetime.time(16, 0))])
-            ],
+            "time_recurrences": [TIME_RECURRENCE_DATA],
             "user": self.user,
         }
         serializer = TimeslotSerializer(
-            context={"request": request},
+            context={"request": self.request},
         )
         # serializer.create works on already validated data
         with self.assertRaises(IntegrityError):